@@ -3,7 +3,7 @@
 Benchmark orchestrator:
 1. Starting Valkey infrastructure
 2. Running benchmark application
-3. Collecting system metrics (perf, CPU, disk I/O, network)
+3. Collecting system metrics (perf, CPU, disk I/O, network via /proc)
 4. Outputting results to JSON and PostgreSQL
 
 The benchmark app writes NDJSON metrics (one JSON object per line).
@@ -11,32 +11,35 @@ Each line contains phase info, totals, and per-command metrics with HDR latency
 """
 
 import argparse
+import collections
 import csv
-import json
+import functools
+import gzip
+import io
 import os
-import random
-import re
+import secrets
 import shutil
 import signal
-import string
+import socket
 import subprocess
 import tempfile
 import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
-import boto3
-import psycopg2
+import orjson
+from inotify_simple import INotify, flags
 from hdrh.histogram import HdrHistogram
-from psycopg2.extras import Json
 
 
 def generate_job_id(prefix: str = ""):
     now = datetime.now(timezone.utc)
-    random_suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    random_suffix = secrets.token_hex(3)
     base = f"bench-{now.strftime('%Y%m%d-%H%M%S')}-{random_suffix}"
     if prefix:
         return f"{prefix}-{base}"
@@ -48,8 +51,66 @@ def get_timestamp():
 
 
 def load_json_config(filepath: Path) -> dict:
-    with open(filepath) as f:
-        return json.load(f)
+    """
+    Load a JSON config, parsing each file only once per modification.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    filepath = Path(filepath).resolve()
+    return _load_json_config_cached(filepath, filepath.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json_config_cached(filepath: Path, _mtime_ns: int) -> dict:
+    with open(filepath, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _jsonb(obj):
+    """Wrap obj for a JSONB parameter, serializing with orjson instead of json.dumps."""
+    from psycopg2.extras import Json
+    return Json(obj, dumps=lambda o: orjson.dumps(o).decode())
+
+
+@functools.lru_cache(maxsize=None)
+def _find_benchmark_jars(target_dir: Path, _mtime_ns: int) -> tuple:
+    """
+    List the shaded benchmark JARs in target_dir (excludes -sources, -javadoc,
+    original-). Cached per directory modification, like load_json_config.
+    """
+    with os.scandir(target_dir) as entries:
+        return tuple(Path(e.path) for e in entries
+                     if e.name.startswith("resp-bench-java-")
+                     and e.name.endswith(".jar")
+                     and "-sources" not in e.name
+                     and "-javadoc" not in e.name)
+
+
+def copy_file(src: Path, dst: Path):
+    """Copy src to dst in kernel space with os.sendfile."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+
+
+def link_or_copy(src: Path, dst: Path):
+    """Hardlink src to dst, falling back to copy_file across filesystems."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy_file(src, dst)
+
+
+def gzip_file(src: Path, dst: Path):
+    """Stream-compress src into dst in 1 MiB blocks."""
+    with open(src, "rb") as fsrc, gzip.open(dst, "wb", compresslevel=6) as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=1 << 20)
 
 
 def extract_buckets_from_hdr(payload_b64: str) -> list:
@@ -63,13 +124,13 @@ def extract_buckets_from_hdr(payload_b64: str) -> list:
     try:
         # Pass base64 string directly - hdrh handles decoding internally
         histogram = HdrHistogram.decode(payload_b64)
-        buckets = []
-        for item in histogram.get_recorded_iterator():
-            buckets.append([
-                item.value_iterated_to,
-                item.count_at_value_iterated_to
-            ])
-        return buckets
+        # Scan the raw counts array and only compute bucket bounds for
+        # non-zero slots; hdrh's recorded iterator does several method
+        # calls for every slot, empty or not
+        value_at = histogram.get_value_from_index
+        upper_bound = histogram.get_highest_equivalent_value
+        return [[upper_bound(value_at(index)), count]
+                for index, count in enumerate(histogram.counts) if count]
     except Exception as e:
         print(f"Warning: Failed to decode HDR histogram: {e}")
         return []
@@ -80,22 +141,70 @@ def add_buckets_to_phase_records(phase_records: dict) -> dict:
     Process phase records and add explicit buckets to each command's latency data.
     Modifies the records in place and returns them.
     """
-    for _, record in phase_records.items():
-        metrics = record.get("metrics", {})
-        for _, cmd_data in metrics.items():
-            latency = cmd_data.get("latency", {})
-            hdr = latency.get("hdr", {})
-            payload = hdr.get("payload_b64", "")
+    # Identical payloads (e.g. an idle command in several phases) are
+    # decoded only once
+    decoded = {}
+    for record in phase_records.values():
+        for cmd_data in record.get("metrics", {}).values():
+            hdr = cmd_data.get("latency", {}).get("hdr")
+            if not hdr:
+                continue
+            payload = hdr.get("payload_b64")
             if payload and "buckets" not in hdr:
-                hdr["buckets"] = extract_buckets_from_hdr(payload)
+                buckets = decoded.get(payload)
+                if buckets is None:
+                    buckets = decoded[payload] = extract_buckets_from_hdr(payload)
+                hdr["buckets"] = buckets
 
     return phase_records
 
 
+_boto3_clients = {}
+_boto3_clients_lock = threading.Lock()
+
+
+def _get_boto3_client(service_name: str, region: str):
+    """
+    Return a shared boto3 client per (service, region).
+    boto3 is imported on first use since its import and client bootstrap
+    are expensive and not needed when nothing is uploaded or published.
+    Clients are created under a lock: the post-run pool asks for the S3 and
+    Secrets Manager clients concurrently, and boto3's default session is
+    not thread-safe.
+    """
+    with _boto3_clients_lock:
+        client = _boto3_clients.get((service_name, region))
+        if client is None:
+            import boto3
+            client = boto3.client(service_name, region_name=region)
+            _boto3_clients[(service_name, region)] = client
+        return client
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3_transfer_config():
+    """Multipart, multi-threaded transfer settings for large artifact uploads."""
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(multipart_threshold=8 * 1024 * 1024,
+                          multipart_chunksize=8 * 1024 * 1024,
+                          max_concurrency=8, use_threads=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_secret_credentials(secret_name: str, region: str) -> dict:
+    """Fetch DB credentials from Secrets Manager once per process."""
+    client = _get_boto3_client('secretsmanager', region)
+    response = client.get_secret_value(SecretId=secret_name)
+    secret = orjson.loads(response['SecretString'])
+    return {'username': secret.get('username'), 'password': secret.get('password')}
+
+
 class PostgreSQLPublisher:
     """Publishes benchmark results to Aurora PostgreSQL"""
 
     TABLE_NAME = "benchmark_results"
+    POOL_MIN_CONN = 1
+    POOL_MAX_CONN = 4
 
     def __init__(self, host: str, port: int = 5432, database: str = "postgres",
                  secret_name: str = None, region: str = "us-east-1"):
@@ -104,24 +213,29 @@ class PostgreSQLPublisher:
         self.database = database
         self.secret_name = secret_name
         self.region = region
-        self.connection = None
+        self._pool = None
+        self._schema_checked = False
 
     def _get_credentials(self) -> dict:
-        client = boto3.client('secretsmanager', region_name=self.region)
-        response = client.get_secret_value(SecretId=self.secret_name)
-        secret = json.loads(response['SecretString'])
-        return {'username': secret.get('username'), 'password': secret.get('password')}
+        return _get_secret_credentials(self.secret_name, self.region)
 
     def connect(self):
+        if self._pool:
+            return
+        # psycopg2 is only imported when results are actually published
+        from psycopg2.pool import ThreadedConnectionPool
         creds = self._get_credentials()
-        self.connection = psycopg2.connect(
+        self._pool = ThreadedConnectionPool(
+            self.POOL_MIN_CONN, self.POOL_MAX_CONN,
             host=self.host, port=self.port, database=self.database,
             user=creds['username'], password=creds['password'],
-            sslmode='require', connect_timeout=10
+            sslmode='require', connect_timeout=10,
+            keepalives=1, keepalives_idle=30, keepalives_interval=10,
+            keepalives_count=3
         )
         print(f"✓ Connected to PostgreSQL at {self.host}:{self.port}/{self.database}")
 
-    def _ensure_table_exists(self):
+    def _ensure_table_exists(self, connection):
         create_table_sql = f"""
         CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
             id SERIAL PRIMARY KEY,
@@ -147,40 +261,113 @@ class PostgreSQLPublisher:
         CREATE INDEX IF NOT EXISTS idx_{self.TABLE_NAME}_secondary_version
             ON {self.TABLE_NAME} ((versions->>'secondary_driver_version'));
         """
-        with self.connection.cursor() as cursor:
+        with connection.cursor() as cursor:
             cursor.execute(create_table_sql)
-        self.connection.commit()
+        connection.commit()
         print(f"✓ Ensured table '{self.TABLE_NAME}' exists")
 
     def publish(self, job_id: str, timestamp: str, versions: dict,
                 config: dict, results: dict):
-        if not self.connection:
-            self.connect()
-        self._ensure_table_exists()
+        row_id = self.publish_many([(job_id, timestamp, versions, config, results)])[0]
+        print(f"✓ Published results for job '{job_id}' (row id: {row_id})")
+
+    def publish_many(self, rows: list) -> list:
+        """
+        Upsert (job_id, timestamp, versions, config, results) rows in one
+        statement. Returns the row ids in input order; when a job_id repeats
+        only its last row is written.
+        """
+        from psycopg2.extras import execute_values
+        self.connect()
 
+        latest = {row[0]: row for row in rows}
         insert_sql = f"""
         INSERT INTO {self.TABLE_NAME} (job_id, timestamp, versions, config, results)
-        VALUES (%s, %s, %s, %s, %s)
+        VALUES %s
         ON CONFLICT (job_id) DO UPDATE SET
             timestamp = EXCLUDED.timestamp,
             versions = EXCLUDED.versions,
             config = EXCLUDED.config,
             results = EXCLUDED.results,
             created_at = NOW()
-        RETURNING id
+        RETURNING job_id, id
         """
-        with self.connection.cursor() as cursor:
-            cursor.execute(insert_sql, (
-                job_id, timestamp, Json(versions), Json(config), Json(results)
-            ))
-            row_id = cursor.fetchone()[0]
-        self.connection.commit()
-        print(f"✓ Published results for job '{job_id}' (row id: {row_id})")
+        connection = self._pool.getconn()
+        try:
+            if not self._schema_checked:
+                self._ensure_table_exists(connection)
+                self._schema_checked = True
+            with connection.cursor() as cursor:
+                returned = execute_values(cursor, insert_sql, [
+                    (job_id, timestamp, _jsonb(versions), _jsonb(config), _jsonb(results))
+                    for job_id, timestamp, versions, config, results in latest.values()
+                ], fetch=True)
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            self._pool.putconn(connection)
+        ids = dict(returned)
+        return [ids[row[0]] for row in rows]
+
+    def publish_copy(self, rows: list) -> int:
+        """
+        Bulk-load (job_id, timestamp, versions, config, results) rows for
+        historical backfill. Rows are streamed with COPY FROM STDIN (CSV) into
+        a staging table and upserted from there, so existing job_ids are
+        overwritten exactly as in publish_many. Returns the number of rows written.
+        """
+        self.connect()
+
+        latest = {row[0]: row for row in rows}
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for job_id, timestamp, versions, config, results in latest.values():
+            writer.writerow((job_id, timestamp, orjson.dumps(versions).decode(),
+                             orjson.dumps(config).decode(), orjson.dumps(results).decode()))
+        buf.seek(0)
+
+        columns = "job_id, timestamp, versions, config, results"
+        connection = self._pool.getconn()
+        try:
+            if not self._schema_checked:
+                self._ensure_table_exists(connection)
+                self._schema_checked = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"""
+                CREATE TEMP TABLE {self.TABLE_NAME}_staging
+                    (job_id VARCHAR(100), timestamp TIMESTAMPTZ,
+                     versions JSONB, config JSONB, results JSONB)
+                    ON COMMIT DROP
+                """)
+                cursor.copy_expert(
+                    f"COPY {self.TABLE_NAME}_staging ({columns}) "
+                    f"FROM STDIN WITH (FORMAT csv, QUOTE '\"')", buf)
+                cursor.execute(f"""
+                INSERT INTO {self.TABLE_NAME} ({columns})
+                SELECT {columns} FROM {self.TABLE_NAME}_staging
+                ON CONFLICT (job_id) DO UPDATE SET
+                    timestamp = EXCLUDED.timestamp,
+                    versions = EXCLUDED.versions,
+                    config = EXCLUDED.config,
+                    results = EXCLUDED.results,
+                    created_at = NOW()
+                """)
+                count = cursor.rowcount
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            self._pool.putconn(connection)
+        print(f"✓ Bulk-loaded {count} rows into '{self.TABLE_NAME}'")
+        return count
 
     def close(self):
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        if self._pool:
+            self._pool.closeall()
+            self._pool = None
             print("✓ PostgreSQL connection closed")
 
     def __enter__(self):
@@ -201,6 +388,10 @@ class VarianceControl:
         self.tc_configured = False
         self.nmi_watchdog_original = None
         self.smt_original = None
+        # Knob writes that need root are queued and applied with one sudo
+        # call at the end of setup()/teardown()
+        self._use_sudo = os.geteuid() != 0
+        self._sudo_writes: list[tuple[str, str]] = []
 
     def setup(self, network_delay: str = "", network_jitter: str = "",
               network_delay_distribution: str = ""):
@@ -211,6 +402,7 @@ class VarianceControl:
                                   network_delay_distribution)
         self._disable_nmi_watchdog()
         self._set_perf_permissions()
+        self._flush_sudo_writes()
         print("Variance control setup complete")
 
     def teardown(self):
@@ -219,8 +411,35 @@ class VarianceControl:
         self._restore_turbo_boost()
         self._remove_network_delay()
         self._restore_nmi_watchdog()
+        self._flush_sudo_writes()
         print("System settings restored")
 
+    def _write_sysfs(self, path: Path, value: str):
+        """Write a sysfs/procfs knob directly as root, else queue it for sudo."""
+        if not self._use_sudo:
+            try:
+                with open(path, "w") as f:
+                    f.write(value)
+                return
+            except PermissionError:
+                self._use_sudo = True
+        self._sudo_writes.append((str(path), value))
+
+    def _flush_sudo_writes(self):
+        """Apply all queued knob writes with a single sudo invocation."""
+        if not self._sudo_writes:
+            return
+        script = ('rc=0; while [ $# -gt 1 ]; do printf %s "$2" > "$1" || rc=1; '
+                  'shift 2; done; exit $rc')
+        args = [arg for write in self._sudo_writes for arg in write]
+        self._sudo_writes = []
+        result = subprocess.run(["sudo", "sh", "-c", script, "sh", *args],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                text=True)
+        if result.returncode != 0:
+            print(f"  ⚠ Some system settings could not be written: "
+                  f"{result.stderr.strip()}")
+
     def _disable_turbo_boost(self):
         intel_path = Path("/sys/devices/system/cpu/intel_pstate/no_turbo")
         amd_path = Path("/sys/devices/system/cpu/cpufreq/boost")
@@ -228,14 +447,12 @@ class VarianceControl:
             if intel_path.exists():
                 self.turbo_boost_path = intel_path
                 self.original_turbo_state = intel_path.read_text().strip()
-                subprocess.run(["sudo", "tee", str(intel_path)], input=b"1",
-                               capture_output=True)
+                self._write_sysfs(intel_path, "1")
                 print("  ✓ Intel Turbo Boost disabled")
             elif amd_path.exists():
                 self.turbo_boost_path = amd_path
                 self.original_turbo_state = amd_path.read_text().strip()
-                subprocess.run(["sudo", "tee", str(amd_path)], input=b"0",
-                               capture_output=True)
+                self._write_sysfs(amd_path, "0")
                 print("  ✓ AMD Boost disabled")
             else:
                 print("  ⚠ No turbo boost control found")
@@ -245,9 +462,7 @@ class VarianceControl:
     def _restore_turbo_boost(self):
         if self.turbo_boost_path and self.original_turbo_state:
             try:
-                subprocess.run(["sudo", "tee", str(self.turbo_boost_path)],
-                               input=self.original_turbo_state.encode(),
-                               capture_output=True)
+                self._write_sysfs(self.turbo_boost_path, self.original_turbo_state)
                 print("  ✓ Turbo boost restored")
             except Exception as e:
                 print(f"  ⚠ Could not restore turbo boost: {e}")
@@ -259,8 +474,7 @@ class VarianceControl:
             if smt_control.exists():
                 self.smt_original = smt_control.read_text().strip()
                 if self.smt_original != "off":
-                    subprocess.run(["sudo", "tee", str(smt_control)],
-                                   input=b"off", capture_output=True)
+                    self._write_sysfs(smt_control, "off")
                     print("  ✓ SMT (hyperthreading) disabled")
                 else:
                     print("  ✓ SMT already disabled")
@@ -274,9 +488,7 @@ class VarianceControl:
         if self.smt_original and self.smt_original != "off":
             smt_control = Path("/sys/devices/system/cpu/smt/control")
             try:
-                subprocess.run(["sudo", "tee", str(smt_control)],
-                               input=self.smt_original.encode(),
-                               capture_output=True)
+                self._write_sysfs(smt_control, self.smt_original)
                 print("  ✓ SMT restored")
             except Exception as e:
                 print(f"  ⚠ Could not restore SMT: {e}")
@@ -287,7 +499,7 @@ class VarianceControl:
             return
         try:
             subprocess.run(["sudo", "tc", "qdisc", "del", "dev", "lo", "root"],
-                           capture_output=True)
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             cmd = ["sudo", "tc", "qdisc", "add", "dev", "lo", "root", "netem",
                    "delay", delay]
             if jitter:
@@ -312,7 +524,7 @@ class VarianceControl:
         if self.tc_configured:
             try:
                 subprocess.run(["sudo", "tc", "qdisc", "del", "dev", "lo", "root"],
-                               capture_output=True)
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 print("  ✓ Network delay removed")
             except Exception as e:
                 print(f"  ⚠ Could not remove network delay: {e}")
@@ -322,8 +534,7 @@ class VarianceControl:
             nmi_path = Path("/proc/sys/kernel/nmi_watchdog")
             if nmi_path.exists():
                 self.nmi_watchdog_original = nmi_path.read_text().strip()
-                subprocess.run(["sudo", "tee", str(nmi_path)], input=b"0",
-                               capture_output=True)
+                self._write_sysfs(nmi_path, "0")
                 print("  ✓ NMI watchdog disabled")
         except Exception as e:
             print(f"  ⚠ Could not disable NMI watchdog: {e}")
@@ -331,26 +542,76 @@ class VarianceControl:
     def _restore_nmi_watchdog(self):
         if self.nmi_watchdog_original:
             try:
-                subprocess.run(["sudo", "tee", "/proc/sys/kernel/nmi_watchdog"],
-                               input=self.nmi_watchdog_original.encode(),
-                               capture_output=True)
+                self._write_sysfs(Path("/proc/sys/kernel/nmi_watchdog"),
+                                  self.nmi_watchdog_original)
                 print("  ✓ NMI watchdog restored")
             except Exception as e:
                 print(f"  ⚠ Could not restore NMI watchdog: {e}")
 
     def _set_perf_permissions(self):
         try:
-            subprocess.run(["sudo", "sysctl", "-w", "kernel.perf_event_paranoid=-1"],
-                           capture_output=True)
-            subprocess.run(["sudo", "sysctl", "-w", "kernel.kptr_restrict=0"],
-                           capture_output=True)
+            self._write_sysfs(Path("/proc/sys/kernel/perf_event_paranoid"), "-1")
+            self._write_sysfs(Path("/proc/sys/kernel/kptr_restrict"), "0")
             print("  ✓ Perf permissions configured")
         except Exception as e:
             print(f"  ⚠ Could not set perf permissions: {e}")
 
 
+class PipeDrainer:
+    """
+    Drains a child's stdout/stderr pipes on background threads so the child
+    never blocks on a full pipe buffer while it is being measured.
+    Only the most recent MAX_BYTES of each stream are kept.
+    """
+
+    MAX_BYTES = 4 * 1024 * 1024
+    CHUNK_SIZE = 65536
+
+    def __init__(self, proc: subprocess.Popen):
+        self.proc = proc
+        self._stdout = collections.deque()
+        self._stderr = collections.deque()
+        self._threads = []
+        for stream, chunks in ((proc.stdout, self._stdout),
+                               (proc.stderr, self._stderr)):
+            if stream is None:
+                continue
+            thread = threading.Thread(target=self._drain, args=(stream, chunks),
+                                      daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _drain(self, stream, chunks: collections.deque):
+        fd = stream.fileno()
+        # Only this thread mutates chunks, so the running size stays local
+        size = 0
+        try:
+            while True:
+                chunk = os.read(fd, self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+                while size > self.MAX_BYTES:
+                    size -= len(chunks.popleft())
+        except OSError:
+            pass
+        finally:
+            stream.close()
+
+    def communicate(self, timeout: Optional[float] = None) -> tuple:
+        """Wait for the process to exit and return (stdout, stderr) bytes."""
+        self.proc.wait(timeout=timeout)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        return b"".join(self._stdout), b"".join(self._stderr)
+
+
 class MetricsWatcher:
-    """Watches a NDJSON metrics file for phase transitions using tail -f."""
+    """Watches a NDJSON metrics file for phase transitions using inotify."""
+
+    # Upper bound on how long the reader sleeps between stop checks
+    POLL_TIMEOUT_MS = 500
 
     def __init__(self, metrics_path: Path):
         self.metrics_path = metrics_path
@@ -358,58 +619,77 @@ class MetricsWatcher:
         self.steady_done_event = threading.Event()
         self.error_event = threading.Event()
         self.error_message: Optional[str] = None
-        self.tail_process: Optional[subprocess.Popen] = None
+        self._stop_event = threading.Event()
+        self._benchmark_proc: Optional[subprocess.Popen] = None
         self.watcher_thread: Optional[threading.Thread] = None
-        self.phase_records: dict = {}
+        # Single writer (the watcher thread); readers only look after the
+        # corresponding phase event is set, so only writes take the lock.
+        self.phase_records: dict[str, dict] = {}
+        self._lock = threading.Lock()
 
-    def start(self, benchmark_proc: Optional[subprocess.Popen] = None):
+    def start(self, benchmark_proc: Optional[subprocess.Popen] = None,
+              benchmark_output: Optional[PipeDrainer] = None):
         print(f"Waiting for metrics file: {self.metrics_path}")
-        last_status_time = time.time()
-        while not self.metrics_path.exists():
-            # Check if benchmark process died
-            if benchmark_proc and benchmark_proc.poll() is not None:
-                stdout, stderr = benchmark_proc.communicate()
-                print("=== Benchmark crashed! ===")
-                print("=== stdout ===")
-                print(stdout.decode() if stdout else "(empty)")
-                print("=== stderr ===")
-                print(stderr.decode() if stderr else "(empty)")
-                raise RuntimeError(
-                    f"Benchmark process died with exit code {benchmark_proc.returncode}")
-            # Print status every 30 seconds
-            if time.time() - last_status_time > 30:
-                elapsed = int(time.time() - last_status_time)
-                print(f"Still waiting for metrics file... (benchmark process running)")
-                last_status_time = time.time()
-            time.sleep(0.1)
-
-        self.tail_process = subprocess.Popen(
-            ["tail", "-f", "-n", "+1", str(self.metrics_path)],
-            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
-        )
+        self._benchmark_proc = benchmark_proc
+        # Monotonic deadline, unaffected by wall-clock adjustments
+        next_status_ns = time.monotonic_ns() + 30 * 10**9
+        # Watch the parent directory so we wake as soon as the file appears;
+        # the watch is added before the exists() check so creation can't be missed
+        with INotify() as dir_watch:
+            dir_watch.add_watch(self.metrics_path.parent, flags.CREATE | flags.MOVED_TO)
+            while not self.metrics_path.exists():
+                # Check if benchmark process died
+                if benchmark_proc and benchmark_proc.poll() is not None:
+                    stdout, stderr = (benchmark_output.communicate()
+                                      if benchmark_output
+                                      else benchmark_proc.communicate())
+                    print("=== Benchmark crashed! ===")
+                    print("=== stdout ===")
+                    print(stdout.decode(errors="replace") if stdout else "(empty)")
+                    print("=== stderr ===")
+                    print(stderr.decode(errors="replace") if stderr else "(empty)")
+                    raise RuntimeError(
+                        f"Benchmark process died with exit code {benchmark_proc.returncode}")
+                # Print status every 30 seconds
+                now_ns = time.monotonic_ns()
+                if now_ns >= next_status_ns:
+                    print(f"Still waiting for metrics file... (benchmark process running)")
+                    next_status_ns = now_ns + 30 * 10**9
+                dir_watch.read(timeout=self.POLL_TIMEOUT_MS)
 
         self.watcher_thread = threading.Thread(target=self._read_loop, daemon=True)
         self.watcher_thread.start()
-        print(f"Started watching metrics (tail -f): {self.metrics_path}")
+        print(f"Started watching metrics (inotify): {self.metrics_path}")
 
     def stop(self):
-        if self.tail_process:
-            self.tail_process.terminate()
-            try:
-                self.tail_process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                self.tail_process.kill()
-            self.tail_process = None
-
+        self._stop_event.set()
         if self.watcher_thread:
             self.watcher_thread.join(timeout=2)
         print("Metrics watcher stopped")
 
     def wait_for_warmup_done(self) -> None:
-        self.warmup_done_event.wait()
+        self._wait_for_phase(self.warmup_done_event, "WARMUP")
 
     def wait_for_steady_done(self) -> None:
-        self.steady_done_event.wait()
+        self._wait_for_phase(self.steady_done_event, "STEADY")
+
+    def _wait_for_phase(self, done_event: threading.Event, phase_id: str):
+        """
+        Wait for a phase event, checking the benchmark process in between so
+        a crash mid-phase is reported as an error instead of blocking forever.
+        """
+        proc = self._benchmark_proc
+        while not done_event.wait(timeout=self.POLL_TIMEOUT_MS / 1000):
+            if proc is None or proc.poll() is None:
+                continue
+            # The final record may still be in flight to the watcher thread
+            if done_event.wait(timeout=2):
+                return
+            self.error_message = (f"Benchmark process exited with code "
+                                  f"{proc.returncode} before {phase_id} completed")
+            print(f"  ✗ {self.error_message}")
+            self.error_event.set()
+            return
 
     def has_error(self) -> bool:
         return self.error_event.is_set()
@@ -421,25 +701,37 @@ class MetricsWatcher:
         return self.phase_records.get(phase_id)
 
     def get_all_phase_records(self) -> dict:
-        return dict(self.phase_records)
+        """Return the live phase records mapping. Callers must treat it as read-only."""
+        return self.phase_records
+
+    def _store_phase_record(self, phase_id: str, record: dict):
+        with self._lock:
+            self.phase_records[phase_id] = record
 
     def _read_loop(self):
-        if not self.tail_process:
-            return
+        with INotify() as inotify, open(self.metrics_path, "rb") as f:
+            # Watch before the first read so no append is missed in between
+            inotify.add_watch(self.metrics_path, flags.MODIFY)
+            pending = b""
+            while not self._stop_event.is_set():
+                data = f.read()
+                if not data:
+                    inotify.read(timeout=self.POLL_TIMEOUT_MS)
+                    continue
 
-        for line in self.tail_process.stdout:
-            line = line.strip()
-            if not line:
-                continue
-            self._process_line(line)
+                *lines, pending = (pending + data).split(b"\n")
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        self._process_line(line)
 
-            if self.warmup_done_event.is_set() and self.steady_done_event.is_set():
-                break
+                if self.warmup_done_event.is_set() and self.steady_done_event.is_set():
+                    break
 
-    def _process_line(self, line: str):
+    def _process_line(self, line: bytes):
         try:
-            record = json.loads(line)
-        except json.JSONDecodeError as e:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
             print(f"  [Metrics] JSON parse error: {e}")
             return
 
@@ -453,13 +745,13 @@ class MetricsWatcher:
             error_msg = record.get("error", "Unknown error")
             self.error_message = f"Phase {phase_id} failed: {error_msg}"
             print(f"  ✗ {self.error_message}")
-            self.phase_records[phase_id] = record
+            self._store_phase_record(phase_id, record)
             self.error_event.set()
             # Unblock waiters so they can check for error
             self.warmup_done_event.set()
             self.steady_done_event.set()
         elif status == "COMPLETED":
-            self.phase_records[phase_id] = record
+            self._store_phase_record(phase_id, record)
 
             if phase_id == "WARMUP" and not self.warmup_done_event.is_set():
                 totals = record.get("totals", {})
@@ -476,6 +768,9 @@ class MetricsWatcher:
 class MonitoringManager:
     """Manages background monitoring processes"""
     ASYNC_PROFILER_PATH = "/opt/async-profiler/bin"
+    HW_PERF_MARKER = Path(tempfile.gettempdir()) / ".bench_hw_perf"
+    _hw_perf_cached: Optional[bool] = None
+    SAMPLE_INTERVAL_S = 1.0
 
     def __init__(self, work_dir: Path):
         self.work_dir = work_dir
@@ -484,21 +779,50 @@ class MonitoringManager:
         self._file_handles = {}
         self.hardware_perf_available = False
         self.collapsed_stacks_file = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+
+    @classmethod
+    def _check_hardware_perf_events(cls) -> bool:
+        """
+        Probe hardware perf event support once per process.
+        A positive result is also kept in a marker file so later runs (and
+        sibling processes) on the host skip the perf invocation. Negative
+        results are never persisted: they may only reflect a run where
+        perf_event_paranoid could not be relaxed.
+        """
+        if cls._hw_perf_cached is not None:
+            return cls._hw_perf_cached
+
+        try:
+            if cls.HW_PERF_MARKER.read_text().strip() == "1":
+                cls._hw_perf_cached = True
+                print("Hardware perf events (cached): AVAILABLE")
+                return True
+        except OSError:
+            pass
 
-    def _check_hardware_perf_events(self) -> bool:
         try:
             result = subprocess.run(
-                ["perf", "stat", "-e", "cycles", "--", "sleep", "0.1"],
+                ["perf", "stat", "-e", "cycles", "--", "true"],
                 capture_output=True, text=True, timeout=5)
             available = ("<not supported>" not in result.stderr
                          and "<not counted>" not in result.stderr)
             print(f"Hardware perf events: "
                   f"{'AVAILABLE' if available else 'NOT AVAILABLE'}")
-            return available
         except Exception as e:
+            # Don't cache failures - perf may simply not be installed yet
             print(f"Hardware perf check failed: {e}")
             return False
 
+        cls._hw_perf_cached = available
+        if available:
+            try:
+                cls.HW_PERF_MARKER.write_text("1")
+            except OSError:
+                pass
+        return available
+
     def _ensure_async_profiler(self) -> bool:
         asprof = Path(self.ASYNC_PROFILER_PATH) / "asprof"
         if asprof.exists():
@@ -506,32 +830,93 @@ class MonitoringManager:
         print(f"⚠ async-profiler not found at {self.ASYNC_PROFILER_PATH}")
         return False
 
-    def start_mpstat(self):
-        output_file = self.work_dir / "mpstat.log"
-        self.output_files["mpstat"] = output_file
+    def _open_sample_log(self, name: str):
+        output_file = self.work_dir / f"{name}.log"
+        self.output_files[name] = output_file
         fh = open(output_file, "w")
-        self._file_handles["mpstat"] = fh
-        proc = subprocess.Popen(["mpstat", "1"], stdout=fh,
-                                stderr=subprocess.DEVNULL, preexec_fn=os.setsid)
-        self.processes["mpstat"] = proc
-
-    def start_iostat(self):
-        output_file = self.work_dir / "iostat.log"
-        self.output_files["iostat"] = output_file
-        fh = open(output_file, "w")
-        self._file_handles["iostat"] = fh
-        proc = subprocess.Popen(["iostat", "-x", "1"], stdout=fh,
-                                stderr=subprocess.DEVNULL, preexec_fn=os.setsid)
-        self.processes["iostat"] = proc
-
-    def start_sar_network(self):
-        output_file = self.work_dir / "sar_network.log"
-        self.output_files["sar_network"] = output_file
-        fh = open(output_file, "w")
-        self._file_handles["sar_network"] = fh
-        proc = subprocess.Popen(["sar", "-n", "DEV", "1"], stdout=fh,
-                                stderr=subprocess.DEVNULL, preexec_fn=os.setsid)
-        self.processes["sar_network"] = proc
+        self._file_handles[name] = fh
+        return fh
+
+    def start_proc_sampler(self):
+        """
+        Sample /proc CPU, disk and network counters once per second from a
+        background thread. Raw counters are logged and turned into rates by
+        parse_cpu_samples / parse_disk_samples / parse_network_samples.
+        """
+        cpu_fh = self._open_sample_log("cpu")
+        disk_fh = self._open_sample_log("disk")
+        network_fh = self._open_sample_log("network")
+        block_devices = {
+            name for name in os.listdir("/sys/block")
+            if not name.startswith(("loop", "ram"))
+        } if os.path.isdir("/sys/block") else set()
+
+        self._sampler_stop.clear()
+        self._sampler_thread = threading.Thread(
+            target=self._sample_loop,
+            args=(cpu_fh, disk_fh, network_fh, block_devices), daemon=True)
+        self._sampler_thread.start()
+        print("Started /proc sampler (cpu, disk, network)")
+
+    def _sample_loop(self, cpu_fh, disk_fh, network_fh, block_devices: set):
+        while True:
+            try:
+                self._sample_proc(time.monotonic_ns(), cpu_fh, disk_fh,
+                                  network_fh, block_devices)
+            except Exception as e:
+                print(f"Warning: /proc sample failed: {e}")
+            if self._sampler_stop.wait(self.SAMPLE_INTERVAL_S):
+                break
+        # Take a final sample on stop so the last partial interval counts
+        try:
+            self._sample_proc(time.monotonic_ns(), cpu_fh, disk_fh,
+                              network_fh, block_devices)
+        except Exception as e:
+            print(f"Warning: /proc sample failed: {e}")
+
+    @staticmethod
+    def _sample_proc(ts: int, cpu_fh, disk_fh, network_fh, block_devices: set):
+        # /proc/stat: "cpu  user nice system idle iowait irq softirq steal guest guest_nice"
+        with open("/proc/stat") as f:
+            cpu_fields = f.readline().split()[1:11]
+        cpu_fh.write(f"{ts} {' '.join(cpu_fields)}\n")
+
+        # /proc/diskstats: major minor name reads merged sectors ms writes merged sectors ...
+        with open("/proc/diskstats") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 10 and parts[2] in block_devices:
+                    disk_fh.write(f"{ts} {parts[2]} {parts[3]} {parts[5]} "
+                                  f"{parts[7]} {parts[9]}\n")
+
+        # /proc/net/dev: "iface: rx_bytes rx_packets (6 more) tx_bytes tx_packets ..."
+        with open("/proc/net/dev") as f:
+            for line in f:
+                iface, sep, counters = line.partition(":")
+                if not sep:
+                    continue
+                iface = iface.strip()
+                parts = counters.split()
+                if iface == "lo" or len(parts) < 10:
+                    continue
+                network_fh.write(f"{ts} {iface} {parts[0]} {parts[1]} "
+                                 f"{parts[8]} {parts[9]}\n")
+
+    def stop_proc_sampler(self):
+        if self._sampler_thread:
+            self._sampler_stop.set()
+            self._sampler_thread.join(timeout=5)
+            self._sampler_thread = None
+
+    @staticmethod
+    def _spawn(cmd: list, **kwargs) -> subprocess.Popen:
+        """
+        Launch a monitor so CPython can use its posix_spawn (vfork) fast path
+        instead of fork+exec: that needs an absolute executable path and
+        close_fds=False, which is safe since Python fds are non-inheritable.
+        """
+        executable = shutil.which(cmd[0]) or cmd[0]
+        return subprocess.Popen([executable, *cmd[1:]], close_fds=False, **kwargs)
 
     def start_perf_stat(self, pid: int):
         output_file = self.work_dir / "perf_stat.log"
@@ -545,8 +930,8 @@ class MonitoringManager:
                       "cpu-migrations,page-faults")
         else:
             events = "context-switches,cpu-migrations,page-faults"
-        proc = subprocess.Popen(["perf", "stat", "-e", events, "-p", str(pid)],
-                                stdout=subprocess.DEVNULL, stderr=fh)
+        proc = self._spawn(["perf", "stat", "-e", events, "-p", str(pid)],
+                           stdout=subprocess.DEVNULL, stderr=fh)
         self.processes["perf_stat"] = proc
         print(f"Started perf stat on PID {pid}")
 
@@ -620,23 +1005,23 @@ class MonitoringManager:
             print("⚠ No collapsed stacks file (async-profiler not started)")
             return None
 
-        if not self.collapsed_stacks_file.exists():
+        try:
+            size = self.collapsed_stacks_file.stat().st_size
+        except FileNotFoundError:
             print("⚠ Collapsed stacks file not found")
             return None
 
-        if self.collapsed_stacks_file.stat().st_size == 0:
+        if size == 0:
             print("⚠ Collapsed stacks file is empty")
             return None
 
-        print(f"✓ Collapsed stacks: {self.collapsed_stacks_file.stat().st_size} bytes")
+        print(f"✓ Collapsed stacks: {size} bytes")
         self.output_files["collapsed_stacks"] = self.collapsed_stacks_file
         return self.collapsed_stacks_file
 
     def start_all(self, benchmark_pid: int):
         self.benchmark_pid = benchmark_pid  # Store for stop_all
-        self.start_mpstat()
-        self.start_iostat()
-        self.start_sar_network()
+        self.start_proc_sampler()
         self.start_perf_stat(benchmark_pid)
         self.start_async_profiler(benchmark_pid)
         print("All monitoring processes started")
@@ -658,17 +1043,20 @@ class MonitoringManager:
             except Exception as e:
                 print(f"Warning stopping perf: {e}")
 
+        # Monitors share our process group, so signal each one directly
+        # rather than via killpg
         for name, proc in self.processes.items():
             try:
-                os.killpg(os.getpgid(proc.pid), signal.SIGTERM)
+                proc.terminate()
                 proc.wait(timeout=5)
-            except (ProcessLookupError, subprocess.TimeoutExpired):
-                try:
-                    os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
-                except ProcessLookupError:
-                    pass
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait(timeout=2)
             except Exception as e:
                 print(f"Warning stopping {name}: {e}")
+        self.processes.clear()
+
+        self.stop_proc_sampler()
 
         for fh in self._file_handles.values():
             try:
@@ -678,172 +1066,253 @@ class MonitoringManager:
         print("All monitoring processes stopped")
 
 
-def parse_mpstat(filepath: Path) -> dict:
+# The sampler's final sample on stop can close an interval of only a few
+# milliseconds; /proc/stat counts in 10 ms ticks, so such intervals are too
+# coarse for percentages or per-second rates and only count towards totals
+_MIN_RATE_INTERVAL_S = MonitoringManager.SAMPLE_INTERVAL_S / 2
+
+
+def _counter_deltas(prev: dict, cur: dict) -> dict:
+    return {key: [c - p for c, p in zip(values, prev[key])]
+            for key, values in cur.items() if key in prev}
+
+
+def _iter_counter_deltas(lines):
+    """
+    Yield (interval_seconds, {key: [deltas]}) between consecutive samples of
+    a /proc sample log, keeping only the previous sample in memory.
+    Lines are "ts key c1 c2 ..." or, for single-key logs, "ts c1 c2 ...".
+    """
+    prev_ts, prev = None, {}
+    cur_ts, cur = None, {}
+    for line in lines:
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        try:
+            ts = int(parts[0])
+            if parts[1].isdigit():
+                key, values = "", [int(v) for v in parts[1:]]
+            else:
+                key, values = parts[1], [int(v) for v in parts[2:]]
+        except ValueError:
+            continue
+        if ts != cur_ts:
+            if prev_ts is not None and cur_ts > prev_ts:
+                yield (cur_ts - prev_ts) / 1e9, _counter_deltas(prev, cur)
+            if cur_ts is not None:
+                prev_ts, prev = cur_ts, cur
+            cur_ts, cur = ts, {}
+        cur[key] = values
+    if prev_ts is not None and cur_ts > prev_ts:
+        yield (cur_ts - prev_ts) / 1e9, _counter_deltas(prev, cur)
+
+
+def parse_cpu_samples(filepath: Path) -> dict:
     result = {
         "user_percent_avg": 0.0, "user_percent_max": 0.0,
         "system_percent_avg": 0.0, "system_percent_max": 0.0,
         "idle_percent_avg": 0.0, "idle_percent_min": 100.0,
         "iowait_percent_avg": 0.0, "steal_percent_avg": 0.0
     }
-    if not filepath.exists():
+    try:
+        f = open(filepath)
+    except FileNotFoundError:
         return result
 
-    user_values, system_values, idle_values = [], [], []
-    iowait_values, steal_values = [], []
-    with open(filepath) as f:
-        for line in f:
-            if "all" in line and not line.startswith("Average"):
-                parts = line.split()
-                if len(parts) >= 12:
-                    try:
-                        user_values.append(float(parts[2]))
-                        system_values.append(float(parts[4]))
-                        iowait_values.append(float(parts[5]))
-                        steal_values.append(float(parts[8]))
-                        idle_values.append(float(parts[11]))
-                    except (ValueError, IndexError):
-                        continue
-
-    if user_values:
-        result["user_percent_avg"] = round(
-            sum(user_values) / len(user_values), 1)
-        result["user_percent_max"] = round(max(user_values), 1)
-    if system_values:
-        result["system_percent_avg"] = round(
-            sum(system_values) / len(system_values), 1)
-        result["system_percent_max"] = round(max(system_values), 1)
-    if idle_values:
-        result["idle_percent_avg"] = round(
-            sum(idle_values) / len(idle_values), 1)
-        result["idle_percent_min"] = round(min(idle_values), 1)
-    if iowait_values:
-        result["iowait_percent_avg"] = round(
-            sum(iowait_values) / len(iowait_values), 1)
-    if steal_values:
-        result["steal_percent_avg"] = round(
-            sum(steal_values) / len(steal_values), 1)
+    # Running aggregates; no per-sample lists are kept
+    count = 0
+    user_sum = system_sum = idle_sum = iowait_sum = steal_sum = 0.0
+    user_max = system_max = 0.0
+    idle_min = 100.0
+    with f:
+        for interval_s, deltas in _iter_counter_deltas(f):
+            if interval_s < _MIN_RATE_INTERVAL_S:
+                continue
+            d = deltas.get("")
+            if not d or len(d) < 8:
+                continue
+            # user nice system idle iowait irq softirq steal [guest guest_nice];
+            # guest time is already included in user/nice
+            total = sum(d[:8])
+            if total <= 0:
+                continue
+            scale = 100.0 / total
+            user = (d[0] - (d[8] if len(d) > 8 else 0)) * scale
+            system = d[2] * scale
+            idle = d[3] * scale
+            count += 1
+            user_sum += user
+            system_sum += system
+            idle_sum += idle
+            iowait_sum += d[4] * scale
+            steal_sum += d[7] * scale
+            user_max = max(user_max, user)
+            system_max = max(system_max, system)
+            idle_min = min(idle_min, idle)
+
+    if count:
+        result["user_percent_avg"] = round(user_sum / count, 1)
+        result["user_percent_max"] = round(user_max, 1)
+        result["system_percent_avg"] = round(system_sum / count, 1)
+        result["system_percent_max"] = round(system_max, 1)
+        result["idle_percent_avg"] = round(idle_sum / count, 1)
+        result["idle_percent_min"] = round(idle_min, 1)
+        result["iowait_percent_avg"] = round(iowait_sum / count, 1)
+        result["steal_percent_avg"] = round(steal_sum / count, 1)
     return result
 
 
-def parse_iostat(filepath: Path) -> dict:
+def parse_disk_samples(filepath: Path) -> dict:
     result = {"read_bytes": 0, "write_bytes": 0, "read_iops": 0, "write_iops": 0}
-    if not filepath.exists():
+    try:
+        f = open(filepath)
+    except FileNotFoundError:
         return result
 
-    read_kb, write_kb, read_iops, write_iops = [], [], [], []
-    with open(filepath) as f:
-        in_device_section = False
-        for line in f:
-            if line.startswith("Device"):
-                in_device_section = True
-                continue
-            if in_device_section and line.strip():
-                parts = line.split()
-                if len(parts) >= 6 and not parts[0].startswith("loop"):
-                    try:
-                        read_iops.append(float(parts[1]))
-                        write_iops.append(float(parts[2]))
-                        read_kb.append(float(parts[3]))
-                        write_kb.append(float(parts[4]))
-                    except (ValueError, IndexError):
-                        continue
-            elif in_device_section and not line.strip():
-                in_device_section = False
-
-    if read_kb:
-        result["read_bytes"] = int(sum(read_kb) * 1024)
-        result["read_iops"] = int(sum(read_iops) / len(read_iops))
-    if write_kb:
-        result["write_bytes"] = int(sum(write_kb) * 1024)
-        result["write_iops"] = int(sum(write_iops) / len(write_iops))
+    count = 0
+    read_bytes = write_bytes = 0
+    read_iops_sum = write_iops_sum = 0.0
+    with f:
+        for interval_s, deltas in _iter_counter_deltas(f):
+            # Per device: reads, sectors_read, writes, sectors_written (512-byte sectors)
+            for d in deltas.values():
+                if len(d) < 4:
+                    continue
+                read_bytes += d[1] * 512
+                write_bytes += d[3] * 512
+                if interval_s < _MIN_RATE_INTERVAL_S:
+                    continue
+                count += 1
+                read_iops_sum += d[0] / interval_s
+                write_iops_sum += d[2] / interval_s
+
+    if count:
+        result["read_bytes"] = read_bytes
+        result["read_iops"] = int(read_iops_sum / count)
+        result["write_bytes"] = write_bytes
+        result["write_iops"] = int(write_iops_sum / count)
     return result
 
 
-def parse_sar_network(filepath: Path) -> dict:
+def parse_network_samples(filepath: Path) -> dict:
     result = {"bytes_sent": 0, "bytes_recv": 0,
               "packets_sent": 0, "packets_recv": 0}
-    if not filepath.exists():
+    try:
+        f = open(filepath)
+    except FileNotFoundError:
         return result
 
-    rx_bytes, tx_bytes, rx_packets, tx_packets = [], [], [], []
-    with open(filepath) as f:
-        for line in f:
-            if "lo" in line or "IFACE" in line or "Average" in line:
-                continue
-            parts = line.split()
-            if len(parts) >= 9:
-                try:
-                    rx_packets.append(float(parts[2]))
-                    tx_packets.append(float(parts[3]))
-                    rx_bytes.append(float(parts[4]) * 1024)
-                    tx_bytes.append(float(parts[5]) * 1024)
-                except (ValueError, IndexError):
+    with f:
+        for _, deltas in _iter_counter_deltas(f):
+            # Per interface: rx_bytes, rx_packets, tx_bytes, tx_packets
+            for d in deltas.values():
+                if len(d) < 4:
                     continue
-
-    if rx_bytes:
-        result["bytes_recv"] = int(sum(rx_bytes))
-        result["bytes_sent"] = int(sum(tx_bytes))
-        result["packets_recv"] = int(sum(rx_packets))
-        result["packets_sent"] = int(sum(tx_packets))
+                result["bytes_recv"] += d[0]
+                result["packets_recv"] += d[1]
+                result["bytes_sent"] += d[2]
+                result["packets_sent"] += d[3]
     return result
 
 
 def convert_collapsed_to_nested_set(collapsed_file: Path,
                                      output_csv: Path) -> bool:
     try:
-        root = {"name": "total", "children": {}, "self_value": 0}
-        with open(collapsed_file) as f:
+        # Aggregate identical stacks first so the tree is walked once per
+        # unique stack rather than once per sample line
+        # Frames stay bytes until a row is written, so no line is decoded
+        counts = collections.Counter()
+        with open(collapsed_file, "rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
-                parts = line.rsplit(" ", 1)
+                parts = line.rsplit(b" ", 1)
                 if len(parts) != 2:
                     continue
-                stack = parts[0]
                 try:
-                    count = int(parts[1])
+                    counts[parts[0]] += int(parts[1])
                 except ValueError:
                     continue
-                frames = stack.split(";")
-                node = root
-                for frame in frames:
-                    if frame not in node["children"]:
-                        node["children"][frame] = {
-                            "name": frame, "children": {}, "self_value": 0}
-                    node = node["children"][frame]
-                node["self_value"] += count
-
-        def calc_total(node):
-            total = node["self_value"]
-            for child in node["children"].values():
-                total += calc_total(child)
-            node["total_value"] = total
-            return total
-
-        calc_total(root)
-        rows = []
-
-        def dfs(node, level):
-            rows.append({"level": level, "value": node["total_value"],
-                         "self": node["self_value"], "label": node["name"]})
-            for child in sorted(node["children"].values(),
-                                key=lambda n: n["total_value"], reverse=True):
-                dfs(child, level + 1)
-
-        dfs(root, 0)
-        with open(output_csv, "w", newline="") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=["level", "value", "self", "label"])
-            writer.writeheader()
-            writer.writerows(rows)
-        print(f"✓ Generated nested set flame graph CSV: {len(rows)} rows")
+
+        # Nodes are keyed by frame name in their parent's children dict
+        root = {"children": {}, "self_value": 0}
+        for stack, count in counts.items():
+            node = root
+            for frame in stack.split(b";"):
+                node = node["children"].setdefault(
+                    frame, {"children": {}, "self_value": 0})
+            node["self_value"] += count
+
+        # Post-order walk with an explicit stack: a node's total is set once
+        # all of its children have been totalled. Java stacks can be deeper
+        # than the interpreter's recursion limit. Children are sorted by
+        # descending total here, once per node, for the CSV walk below.
+        pending = [(root, False)]
+        while pending:
+            node, children_done = pending.pop()
+            if children_done:
+                children = [(child["total_value"], frame, child)
+                            for frame, child in node.pop("children").items()]
+                node["total_value"] = node["self_value"] + sum(
+                    map(itemgetter(0), children))
+                children.sort(key=itemgetter(0), reverse=True)
+                node["sorted_children"] = children
+            else:
+                pending.append((node, True))
+                pending.extend((child, False) for child in node["children"].values())
+
+        # Pre-order walk with an explicit stack, children visited by
+        # descending total. Rows are formatted directly as CSV bytes (same
+        # quoting and \r\n terminator as csv.writer); each distinct frame's
+        # label is sanitized and quoted once.
+        labels = {}
+        row_count = 0
+        with open(output_csv, "wb", buffering=1 << 20) as f:
+            f.write(b"level,value,self,label\r\n")
+            stack = [(b"total", root, 0)]
+            while stack:
+                name, node, level = stack.pop()
+                label = labels.get(name)
+                if label is None:
+                    label = name.decode("utf-8", "replace").encode()
+                    if any(c in label for c in (b",", b'"', b"\r", b"\n")):
+                        label = b'"' + label.replace(b'"', b'""') + b'"'
+                    labels[name] = label
+                f.write(b"%d,%d,%d,%b\r\n" % (level, node["total_value"],
+                                               node["self_value"], label))
+                row_count += 1
+                stack.extend((frame, child, level + 1)
+                             for _, frame, child in reversed(node["sorted_children"]))
+        print(f"✓ Generated nested set flame graph CSV: {row_count} rows")
         return True
     except Exception as e:
         print(f"⚠ Failed to convert to nested set model: {e}")
         return False
 
 
+# perf stat prints one "<count> <event> ..." line per counter; map event
+# names to result keys so the output can be parsed in a single pass
+_PERF_BASE_EVENTS = {
+    b"context-switches": "context_switches",
+    b"cpu-migrations": "cpu_migrations",
+    b"page-faults": "page_faults",
+}
+
+_PERF_HW_EVENTS = {
+    b"cycles": "cpu_cycles",
+    b"instructions": "instructions",
+    b"cache-references": "cache_references",
+    b"cache-misses": "cache_misses",
+    b"branches": "branch_instructions",
+    b"branch-instructions": "branch_instructions",
+    b"branch-misses": "branch_misses",
+}
+
+_PERF_ALL_EVENTS = {**_PERF_BASE_EVENTS, **_PERF_HW_EVENTS}
+
+
 def parse_perf_stat(filepath: Path, hardware_available: bool) -> dict:
     result = {
         "cpu_cycles": None, "instructions": None, "ipc": None,
@@ -853,33 +1322,30 @@ def parse_perf_stat(filepath: Path, hardware_available: bool) -> dict:
         "branch_miss_rate": None,
         "context_switches": 0, "cpu_migrations": 0, "page_faults": 0
     }
-    if not filepath.exists():
+    events = _PERF_ALL_EVENTS if hardware_available else _PERF_BASE_EVENTS
+    remaining = set(events.values())
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
         return result
-
-    content = filepath.read_text()
-    for key, pattern in [
-        ("context_switches", r"([\d,]+)\s+context-switches"),
-        ("cpu_migrations", r"([\d,]+)\s+cpu-migrations"),
-        ("page_faults", r"([\d,]+)\s+page-faults")
-    ]:
-        match = re.search(pattern, content)
-        if match:
-            result[key] = int(match.group(1).replace(",", ""))
+    with f:
+        for line in f:
+            parts = line.split(None, 2)
+            if len(parts) < 2:
+                continue
+            # Events may carry a modifier suffix, e.g. "cycles:u"
+            key = events.get(parts[1].partition(b":")[0])
+            if key is None:
+                continue
+            try:
+                result[key] = int(parts[0].translate(None, b","))
+            except ValueError:
+                continue
+            remaining.discard(key)
+            if not remaining:
+                break
 
     if hardware_available:
-        for key, pattern in [
-            ("cpu_cycles", r"([\d,]+)\s+cycles"),
-            ("instructions", r"([\d,]+)\s+instructions"),
-            ("cache_references", r"([\d,]+)\s+cache-references"),
-            ("cache_misses", r"([\d,]+)\s+cache-misses"),
-            ("branch_instructions",
-             r"([\d,]+)\s+branch(?:es|-instructions)"),
-            ("branch_misses", r"([\d,]+)\s+branch-misses"),
-        ]:
-            match = re.search(pattern, content)
-            if match:
-                result[key] = int(match.group(1).replace(",", ""))
-
         if result["cpu_cycles"] and result["instructions"]:
             result["ipc"] = round(
                 result["instructions"] / result["cpu_cycles"], 2)
@@ -940,9 +1406,6 @@ class BenchmarkOrchestrator:
         # Detect NUMA topology and allocate cores accordingly
         self._setup_numa_aware_cores()
 
-        # Java JAR path - find the shaded JAR dynamically
-        self.java_jar = self._find_java_jar()
-
     def _get_numa_topology(self) -> dict:
         """
         Detect NUMA topology from /sys filesystem.
@@ -981,6 +1444,18 @@ class BenchmarkOrchestrator:
                 cores.append(int(part))
         return sorted(cores)
 
+    def _format_cpulist(self, cores: list) -> str:
+        """Format sorted cores like [0,1,2,3,8,9,10,11] as '0-3,8-11'"""
+        ranges = []
+        start = prev = cores[0]
+        for core in cores[1:]:
+            if core != prev + 1:
+                ranges.append(f"{start}-{prev}" if start != prev else str(start))
+                start = core
+            prev = core
+        ranges.append(f"{start}-{prev}" if start != prev else str(start))
+        return ",".join(ranges)
+
     def _setup_numa_aware_cores(self):
         """
         Detect NUMA topology and allocate cores across NUMA nodes.
@@ -1001,8 +1476,9 @@ class BenchmarkOrchestrator:
             self.benchmark_numa_node = 1
 
             # Use all cores on each node
-            self.infra_cores = f"{node0_cores[0]}-{node0_cores[-1]}"
-            self.benchmark_cores = f"{node1_cores[0]}-{node1_cores[-1]}"
+            self.infra_core_mask = frozenset(node0_cores)
+            self.infra_cores = self._format_cpulist(node0_cores)
+            self.benchmark_cores = self._format_cpulist(node1_cores)
 
             print(f"Split NUMA allocation:")
             print(f"  Server: NUMA node {self.infra_numa_node}, cores {self.infra_cores}")
@@ -1013,20 +1489,22 @@ class BenchmarkOrchestrator:
             self.infra_numa_node = 0
             self.benchmark_numa_node = 0
 
-            all_cores = f"{node_cores[0]}-{node_cores[-1]}"
+            self.infra_core_mask = frozenset(node_cores)
+            all_cores = self._format_cpulist(node_cores)
             self.infra_cores = all_cores
             self.benchmark_cores = all_cores
 
             print(f"Single NUMA node {self.infra_numa_node}: all cores shared")
             print(f"  Cores: {all_cores}")
 
-    def _find_java_jar(self) -> Path:
-        """Find the benchmark JAR file dynamically."""
-        target_dir = self.resp_bench_dir / "java/target"
-        # Look for the shaded JAR (excludes -sources, -javadoc, original-)
-        jars = list(target_dir.glob("resp-bench-java-*.jar"))
-        jars = [j for j in jars if not any(x in j.name for x in
-                ["-sources", "-javadoc", "original-"])]
+    @functools.cached_property
+    def java_jar(self) -> Path:
+        """Find the benchmark JAR file dynamically (resolved on first use)."""
+        target_dir = (self.resp_bench_dir / "java/target").resolve()
+        try:
+            jars = _find_benchmark_jars(target_dir, target_dir.stat().st_mtime_ns)
+        except FileNotFoundError:
+            jars = ()
         if not jars:
             raise RuntimeError(f"No benchmark JAR found in {target_dir}")
         if len(jars) > 1:
@@ -1062,13 +1540,15 @@ class BenchmarkOrchestrator:
             "commit_id": metadata.get("commit_id")
         }
 
-    def _is_cluster_mode(self) -> bool:
+    @functools.cached_property
+    def is_cluster_mode(self) -> bool:
         """Check if the driver config specifies cluster mode."""
         return self.driver_config.get("mode", "standalone") == "cluster"
 
-    def _get_server_port(self) -> int:
+    @functools.cached_property
+    def server_port(self) -> int:
         """Get the primary server port based on mode."""
-        return 7379 if self._is_cluster_mode() else 6379
+        return 7379 if self.is_cluster_mode else 6379
 
     def _pin_server_processes(self):
         """Pin all running valkey-server processes to designated cores and NUMA node."""
@@ -1078,36 +1558,66 @@ class BenchmarkOrchestrator:
             try:
                 pid = int(pid_file.read_text().strip())
                 # Pin CPU to infra cores
-                result = subprocess.run(
-                    ["taskset", "-cp", self.infra_cores, str(pid)],
-                    capture_output=True, text=True)
-                if result.returncode == 0:
-                    pinned += 1
+                if hasattr(os, "sched_setaffinity"):
+                    try:
+                        os.sched_setaffinity(pid, self.infra_core_mask)
+                        pinned += 1
+                    except OSError as e:
+                        print(f"  Warning: Failed to pin PID {pid}: {e}")
                 else:
-                    print(f"  Warning: Failed to pin PID {pid}: {result.stderr}")
+                    result = subprocess.run(
+                        ["taskset", "-cp", self.infra_cores, str(pid)],
+                        capture_output=True, text=True)
+                    if result.returncode == 0:
+                        pinned += 1
+                    else:
+                        print(f"  Warning: Failed to pin PID {pid}: {result.stderr}")
                 # Migrate memory to infra NUMA node
                 subprocess.run(
                     ["migratepages", str(pid), "all", str(self.infra_numa_node)],
-                    capture_output=True, text=True)
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             except (ValueError, FileNotFoundError) as e:
                 print(f"  Warning: Could not read PID from {pid_file}: {e}")
         print(f"Pinned {pinned} server processes to NUMA node {self.infra_numa_node}, cores {self.infra_cores}")
 
+    def _ping_valkey(self, port: int) -> bool:
+        """Send a RESP PING to the local server and check for +PONG."""
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=2) as sock:
+                sock.sendall(b"*1\r\n$4\r\nPING\r\n")
+                return sock.recv(64).startswith(b"+PONG")
+        except OSError as e:
+            print(f"  Warning: PING on port {port} failed: {e}")
+            return False
+
+    def _kill_valkey_servers(self):
+        """SIGTERM every process named valkey-server."""
+        for entry in os.scandir("/proc"):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/comm", "rb") as f:
+                    if f.read().strip() != b"valkey-server":
+                        continue
+                os.kill(int(entry.name), signal.SIGTERM)
+            except (FileNotFoundError, ProcessLookupError, PermissionError):
+                continue
+
     def start_infrastructure(self):
         if self.skip_infra:
             print("Skipping infrastructure setup")
             return
 
-        is_cluster = self._is_cluster_mode()
+        is_cluster = self.is_cluster_mode
         mode_name = "cluster" if is_cluster else "standalone"
         make_target = "server-cluster-init" if is_cluster else "server-standalone-start"
         stop_target = "server-cluster-stop" if is_cluster else "server-standalone-stop"
-        port = self._get_server_port()
+        port = self.server_port
 
         print(f"Starting Valkey {mode_name} infrastructure on NUMA node {self.infra_numa_node}...")
         subprocess.run(["make", stop_target], cwd=self.resp_bench_dir,
-                        capture_output=True)
-        subprocess.run(["pkill", "-f", "valkey-server"], capture_output=True)
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self._kill_valkey_servers()
         time.sleep(1)
 
         work_dir = self.resp_bench_dir / "work"
@@ -1124,10 +1634,7 @@ class BenchmarkOrchestrator:
                 f"(exit code {result.returncode})")
         time.sleep(2)
 
-        valkey_cli = self.resp_bench_dir / "work/valkey/bin/valkey-cli"
-        result = subprocess.run([str(valkey_cli), "-p", str(port), "ping"],
-                                capture_output=True, text=True)
-        if "PONG" not in result.stdout:
+        if not self._ping_valkey(port):
             raise RuntimeError(f"Valkey verification failed on port {port}")
         print(f"Valkey {mode_name} infrastructure started and verified on port {port}")
 
@@ -1137,19 +1644,18 @@ class BenchmarkOrchestrator:
     def stop_infrastructure(self):
         if self.skip_infra:
             return
-        is_cluster = self._is_cluster_mode()
+        is_cluster = self.is_cluster_mode
         mode_name = "cluster" if is_cluster else "standalone"
         stop_target = "server-cluster-stop" if is_cluster else "server-standalone-stop"
 
         print(f"Stopping Valkey {mode_name} infrastructure...")
-        subprocess.run(["make", stop_target], cwd=self.resp_bench_dir,
-                        capture_output=True)
-        subprocess.run(["make", "clean"], cwd=self.resp_bench_dir,
-                        capture_output=True)
+        # One make invocation; -k still runs clean if the stop target fails
+        subprocess.run(["make", "-k", stop_target, "clean"], cwd=self.resp_bench_dir,
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         print("Valkey infrastructure stopped")
 
     def run_benchmark(self, output_metrics: Path) -> subprocess.Popen:
-        port = self._get_server_port()
+        port = self.server_port
         server = f"localhost:{port}"
 
         cmd = [
@@ -1179,18 +1685,31 @@ class BenchmarkOrchestrator:
         return subprocess.Popen(cmd, stdout=subprocess.PIPE,
                                 stderr=subprocess.PIPE)
 
-    def _publish_to_postgresql(self, versions: dict, config: dict,
-                               results: dict):
+    def _connect_publisher(self) -> Optional[PostgreSQLPublisher]:
+        """Fetch credentials and open the PostgreSQL pool ahead of publishing."""
+        try:
+            publisher = PostgreSQLPublisher(
+                host=self.pg_host, port=self.pg_port,
+                database=self.pg_database,
+                secret_name=self.pg_secret_name, region=self.AWS_REGION)
+            publisher.connect()
+            return publisher
+        except Exception as e:
+            print(f"⚠ Failed to connect to PostgreSQL: {e}")
+            traceback.print_exc()
+            return None
+
+    def _publish_to_postgresql(self, publisher: Optional[PostgreSQLPublisher],
+                               versions: dict, config: dict, results: dict):
         if not self.publish_to_db:
             print("Skipping PostgreSQL publication (disabled)")
             return
+        if publisher is None:
+            print("⚠ Skipping PostgreSQL publication (no connection)")
+            return
 
         print("\nPublishing results to PostgreSQL...")
         try:
-            publisher = PostgreSQLPublisher(
-                host=self.pg_host, port=self.pg_port,
-                database=self.pg_database,
-                secret_name=self.pg_secret_name, region=self.AWS_REGION)
             with publisher:
                 publisher.publish(
                     job_id=self.job_id, timestamp=self.timestamp,
@@ -1199,11 +1718,13 @@ class BenchmarkOrchestrator:
             print(f"⚠ Failed to publish to PostgreSQL: {e}")
             traceback.print_exc()
 
-    def _upload_to_s3(self, local_path: Path,
-                      s3_key: str) -> Optional[str]:
+    def _upload_to_s3(self, local_path: Path, s3_key: str,
+                      extra_args: Optional[dict] = None) -> Optional[str]:
         try:
-            s3_client = boto3.client('s3', region_name=self.AWS_REGION)
-            s3_client.upload_file(str(local_path), self.s3_bucket, s3_key)
+            s3_client = _get_boto3_client('s3', self.AWS_REGION)
+            s3_client.upload_file(str(local_path), self.s3_bucket, s3_key,
+                                  ExtraArgs=extra_args,
+                                  Config=_get_s3_transfer_config())
             s3_url = f"s3://{self.s3_bucket}/{s3_key}"
             print(f"✓ Uploaded to {s3_url}")
             return s3_url
@@ -1212,6 +1733,27 @@ class BenchmarkOrchestrator:
             traceback.print_exc()
             return None
 
+    def _upload_gzipped_to_s3(self, local_path: Path, s3_key: str,
+                              content_type: str) -> Optional[str]:
+        """Gzip a text artifact next to local_path and upload it as s3_key."""
+        gz_path = local_path.with_name(local_path.name + ".gz")
+        try:
+            gzip_file(local_path, gz_path)
+        except Exception as e:
+            print(f"⚠ Failed to compress {local_path}: {e}")
+            return None
+        return self._upload_to_s3(
+            gz_path, s3_key,
+            {"ContentEncoding": "gzip", "ContentType": content_type})
+
+    def _upload_nested_set_flamegraph(self, collapsed_file: Path,
+                                      nested_set_csv: Path) -> Optional[str]:
+        """Convert collapsed stacks to the Grafana nested set CSV and upload it."""
+        if not convert_collapsed_to_nested_set(collapsed_file, nested_set_csv):
+            return None
+        return self._upload_gzipped_to_s3(
+            nested_set_csv, f"{self.job_id}/flamegraph_grafana.csv.gz", "text/csv")
+
     def run(self):
         """Execute the full benchmark workflow"""
         # write to the /dev/shm dir as it's in the ram, eliminating disc i/o. 
@@ -1224,9 +1766,11 @@ class BenchmarkOrchestrator:
 
                 print("Starting benchmark...")
                 benchmark_proc = self.run_benchmark(benchmark_metrics)
+                benchmark_output = PipeDrainer(benchmark_proc)
 
                 metrics_watcher = MetricsWatcher(benchmark_metrics)
-                metrics_watcher.start(benchmark_proc=benchmark_proc)
+                metrics_watcher.start(benchmark_proc=benchmark_proc,
+                                      benchmark_output=benchmark_output)
 
                 print("Waiting for WARMUP phase to complete...")
                 metrics_watcher.wait_for_warmup_done()
@@ -1245,59 +1789,79 @@ class BenchmarkOrchestrator:
                 monitor.stop_all()
                 metrics_watcher.stop()
 
-                _, stderr = benchmark_proc.communicate(timeout=10)
-                print(f"Benchmark stderr:\n{stderr.decode()}")
+                _, stderr = benchmark_output.communicate(timeout=10)
+                print(f"Benchmark stderr:\n{stderr.decode(errors='replace')}")
 
-                # Get collapsed stacks from async-profiler and upload to S3
-                collapsed_stacks_url = None
-                nested_set_flamegraph_url = None
                 print("\nCollecting flame graph data from async-profiler...")
                 collapsed_file = monitor.get_collapsed_stacks()
-                if collapsed_file:
-                    s3_key = f"{self.job_id}/collapsed.txt"
-                    collapsed_stacks_url = self._upload_to_s3(
-                        collapsed_file, s3_key)
-
-                    nested_set_csv = work_dir / "flamegraph_grafana.csv"
-                    if convert_collapsed_to_nested_set(
-                            collapsed_file, nested_set_csv):
-                        s3_key = f"{self.job_id}/flamegraph_grafana.csv"
-                        nested_set_flamegraph_url = self._upload_to_s3(
-                            nested_set_csv, s3_key)
-
-                # Collect all phase records from the benchmark
-                all_phases = metrics_watcher.get_all_phase_records()
-
-                # Add explicit buckets to HDR histograms
-                add_buckets_to_phase_records(all_phases)
-
-                steady_record = metrics_watcher.get_phase_record("STEADY")
-
-                # Extract versions from resp-bench metadata (prefer STEADY, fall back to any phase)
-                versions = self._extract_versions_from_metadata(all_phases)
-
-                # Parse system-level metrics
-                perf_counters = parse_perf_stat(
-                    monitor.output_files.get("perf_stat", Path()),
-                    monitor.hardware_perf_available)
-                cpu_stats = parse_mpstat(
-                    monitor.output_files.get("mpstat", Path()))
-                disk_stats = parse_iostat(
-                    monitor.output_files.get("iostat", Path()))
-                network_stats = parse_sar_network(
-                    monitor.output_files.get("sar_network", Path()))
+
+                # S3 uploads, the flame graph conversion and the system
+                # metric parsers are independent; run them on a thread pool
+                # while the phase records are post-processed here.
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    # The secret lookup and connection setup only need the
+                    # CLI options, so they overlap with the work below too
+                    publisher_future = (executor.submit(self._connect_publisher)
+                                        if self.publish_to_db else None)
+                    collapsed_stacks_future = None
+                    nested_set_flamegraph_future = None
+                    if collapsed_file:
+                        collapsed_stacks_future = executor.submit(
+                            self._upload_gzipped_to_s3, collapsed_file,
+                            f"{self.job_id}/collapsed.txt.gz", "text/plain")
+                        nested_set_flamegraph_future = executor.submit(
+                            self._upload_nested_set_flamegraph, collapsed_file,
+                            work_dir / "flamegraph_grafana.csv")
+
+                    perf_future = executor.submit(
+                        parse_perf_stat,
+                        monitor.output_files.get("perf_stat", Path()),
+                        monitor.hardware_perf_available)
+                    cpu_future = executor.submit(
+                        parse_cpu_samples, monitor.output_files.get("cpu", Path()))
+                    disk_future = executor.submit(
+                        parse_disk_samples, monitor.output_files.get("disk", Path()))
+                    network_future = executor.submit(
+                        parse_network_samples,
+                        monitor.output_files.get("network", Path()))
+
+                    # Collect all phase records from the benchmark
+                    all_phases = metrics_watcher.get_all_phase_records()
+
+                    # Add explicit buckets to HDR histograms. Only the
+                    # database consumers read them; the JSON output keeps the
+                    # encoded payload either way.
+                    if self.publish_to_db:
+                        add_buckets_to_phase_records(all_phases)
+
+                    steady_record = metrics_watcher.get_phase_record("STEADY")
+
+                    # Extract versions from resp-bench metadata (prefer STEADY, fall back to any phase)
+                    versions = self._extract_versions_from_metadata(all_phases)
+
+                    collapsed_stacks_url = (collapsed_stacks_future.result()
+                                            if collapsed_stacks_future else None)
+                    nested_set_flamegraph_url = (
+                        nested_set_flamegraph_future.result()
+                        if nested_set_flamegraph_future else None)
+                    perf_counters = perf_future.result()
+                    cpu_stats = cpu_future.result()
+                    disk_stats = disk_future.result()
+                    network_stats = network_future.result()
+                    publisher = (publisher_future.result()
+                                 if publisher_future else None)
 
                 # Copy NDJSON metrics to output directory
                 output_metrics_path = self.output_file.with_suffix('.ndjson')
                 if benchmark_metrics.exists():
-                    shutil.copy(benchmark_metrics, output_metrics_path)
+                    link_or_copy(benchmark_metrics, output_metrics_path)
                     print(f"Benchmark metrics saved to {output_metrics_path}")
 
                 # Copy collapsed stacks to output directory for artifact upload
                 if collapsed_file and collapsed_file.exists():
                     output_collapsed_path = self.output_file.with_name(
                         self.output_file.stem + '_collapsed.txt')
-                    shutil.copy(collapsed_file, output_collapsed_path)
+                    link_or_copy(collapsed_file, output_collapsed_path)
                     print(f"Collapsed stacks saved to {output_collapsed_path}")
 
                 # Build result structure
@@ -1339,13 +1903,13 @@ class BenchmarkOrchestrator:
                     "results": results
                 }
 
-                with open(self.output_file, "w") as f:
-                    json.dump(output, f, indent=2)
+                with open(self.output_file, "wb") as f:
+                    f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
 
                 print(f"\nResults written to {self.output_file}")
 
                 # Publish to PostgreSQL
-                self._publish_to_postgresql(versions, config, results)
+                self._publish_to_postgresql(publisher, versions, config, results)
 
             finally:
                 self.stop_infrastructure()